@@ -1,12 +1,21 @@
-from . import (
-    actions,
-    command_sender,
-    manager,
-    models,
-    types,
-    utils,
-    websocket,
-)
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING
+
+
+if TYPE_CHECKING:
+    from types import ModuleType
+
+    from . import (
+        actions,
+        command_sender,
+        manager,
+        models,
+        types,
+        utils,
+        websocket,
+    )
 
 
 __all__ = [
@@ -18,3 +27,16 @@ __all__ = [
     "utils",
     "websocket",
 ]
+
+
+def __getattr__(name: str) -> ModuleType:
+    """Lazily import submodules on first attribute access (PEP 562).
+
+    This keeps `import streamdeck` (and the plugin entry-point) from eagerly paying the import cost of
+    every submodule and its third-party dependencies.
+    """
+    if name in __all__:
+        return importlib.import_module(f".{name}", __name__)
+
+    msg = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(msg)
@@ -2,26 +2,18 @@ from __future__ import annotations
 
 import importlib.util
 import json
-import logging
 import sys
-from argparse import ArgumentParser
+from importlib.machinery import SourceFileLoader
 from pathlib import Path
+from types import SimpleNamespace
 from typing import TYPE_CHECKING, cast
 
-import tomli as toml
-
 from streamdeck.actions import Action
 from streamdeck.cli.errors import (
+    CliArgumentError,
     DirectoryNotFoundError,
     NotAFileError,
 )
-from streamdeck.cli.models import (
-    CliArgsNamespace,
-    PyProjectConfigDict,
-    StreamDeckConfigDict,
-)
-from streamdeck.manager import PluginManager
-from streamdeck.utils.logging import configure_streamdeck_logger
 
 
 if TYPE_CHECKING:
@@ -30,42 +22,98 @@ if TYPE_CHECKING:
     from types import ModuleType
     from typing_extensions import Self  # noqa: UP035
 
+    from streamdeck.cli.models import (
+        CliArgsNamespace,
+        PyProjectConfigDict,
+        StreamDeckConfigDict,
+    )
+
+
+CLI_USAGE = """\
+usage: streamdeck [-h] [plugin_dir | --action-scripts ACTION_SCRIPTS [ACTION_SCRIPTS ...]]
+                  -port PORT -pluginUUID PLUGINUUID -registerEvent REGISTEREVENT -info INFO
+
+CLI to load Actions from action scripts.
+"""
+
+# Options that will always be passed in by the StreamDeck software when running this plugin.
+_REQUIRED_SD_OPTIONS = ("-port", "-pluginUUID", "-registerEvent", "-info")
 
-logger = logging.getLogger("streamdeck")
+# Loaded action script modules are registered in `sys.modules` under this prefix, so that they can't
+# shadow real modules (e.g. a script named `logging.py`), or each other.
+_ACTION_MODULES_NAMESPACE = "_streamdeck_actions"
 
 
-def setup_cli() -> ArgumentParser:
-    """Set up the command-line interface for the script.
+def parse_cli_args(argv: list[str]) -> CliArgsNamespace:
+    """Parse the command-line arguments for the script.
+
+    The StreamDeck software always launches the plugin with the same small, fixed set of options,
+    so a simple scan of the args avoids importing and building an `argparse` parser on every plugin start.
+
+    Args:
+        argv (list[str]): The command-line arguments, excluding the program name (i.e. `sys.argv[1:]`).
 
     Returns:
-        argparse.ArgumentParser: The argument parser for the CLI.
+        CliArgsNamespace: The parsed command-line arguments.
+
+    Raises:
+        CliArgumentError: If an option is unrecognized, missing its value, or a required option is missing.
     """
-    parser = ArgumentParser(description="CLI to load Actions from action scripts.")
-    group = parser.add_mutually_exclusive_group(required=False)
-    group.add_argument(
-        "plugin_dir",
-        type=Path,
-        nargs="?",
-        help="The directory containing plugin files to load Actions from.",
-    )
-    group.add_argument(
-        "--action-scripts",
-        type=str,
-        nargs="+",
-        help="A list of action script file paths to load Actions from or a single value to be processed.",
-    )
+    options: dict[str, str] = {}
+    plugin_dir: Path | None = None
+    action_scripts: list[str] | None = None
+
+    i = 0
+    while i < len(argv):
+        arg = argv[i]
+        i += 1
+
+        if arg in _REQUIRED_SD_OPTIONS:
+            if i >= len(argv):
+                msg = f"argument {arg}: expected one argument"
+                raise CliArgumentError(msg)
+            options[arg] = argv[i]
+            i += 1
+
+        elif arg == "--action-scripts":
+            # Consume values until the next option flag (or the end of the args).
+            start = i
+            while i < len(argv) and not argv[i].startswith("-"):
+                i += 1
+            action_scripts = argv[start:i]
+            if not action_scripts:
+                msg = "argument --action-scripts: expected at least one argument"
+                raise CliArgumentError(msg)
+
+        elif not arg.startswith("-") and plugin_dir is None:
+            plugin_dir = Path(arg)
+
+        else:
+            msg = f"unrecognized argument: {arg}"
+            raise CliArgumentError(msg)
+
+    if plugin_dir is not None and action_scripts is not None:
+        msg = "argument --action-scripts: not allowed with argument plugin_dir"
+        raise CliArgumentError(msg)
+
+    if missing := [option for option in _REQUIRED_SD_OPTIONS if option not in options]:
+        msg = f"the following arguments are required: {', '.join(missing)}"
+        raise CliArgumentError(msg)
 
-    # Options that will always be passed in by the StreamDeck software when running this plugin.
-    parser.add_argument("-port", dest="port", type=int, help="Port", required=True)
-    parser.add_argument(
-        "-pluginUUID", dest="pluginUUID", type=str, help="pluginUUID", required=True
-    )
-    parser.add_argument(
-        "-registerEvent", dest="registerEvent", type=str, help="registerEvent", required=True
-    )
-    parser.add_argument("-info", dest="info", type=str, help="info", required=True)
+    try:
+        port = int(options["-port"])
+    except ValueError as e:
+        msg = f"argument -port: invalid int value: '{options['-port']}'"
+        raise CliArgumentError(msg) from e
 
-    return parser
+    return cast("CliArgsNamespace", SimpleNamespace(
+        plugin_dir=plugin_dir,
+        action_scripts=action_scripts,
+        port=port,
+        pluginUUID=options["-pluginUUID"],
+        registerEvent=options["-registerEvent"],
+        info=options["-info"],
+    ))
 
 
 def determine_action_scripts(
@@ -117,51 +165,130 @@ def read_streamdeck_config_from_pyproject(plugin_dir: Path) -> StreamDeckConfigD
         NotADirectoryError: If the specified plugin_dir is not a directory.
         FileNotFoundError: If the pyproject.toml file does not exist in the plugin_dir.
     """
+    # Deferred import, as the pyproject.toml is only read when action scripts weren't passed in directly.
+    if sys.version_info >= (3, 11):
+        import tomllib as toml
+    else:
+        import tomli as toml
+
     if not plugin_dir.exists():
         msg = f"The directory '{plugin_dir}' does not exist."
         raise DirectoryNotFoundError(msg, directory=plugin_dir)
 
     pyproject_path = plugin_dir / "pyproject.toml"
-    with pyproject_path.open("rb") as f:
-        try:
-            pyproject_config: PyProjectConfigDict = toml.load(f)
+    try:
+        pyproject_data = pyproject_path.read_bytes()
 
-        except FileNotFoundError as e:
-            msg = f"There is no 'pyproject.toml' in the given directory '{plugin_dir}"
-            raise FileNotFoundError(msg) from e
+    except FileNotFoundError as e:
+        msg = f"There is no 'pyproject.toml' in the given directory '{plugin_dir}"
+        raise FileNotFoundError(msg) from e
 
-        except NotADirectoryError as e:
-            msg = f"The provided directory exists but is not a directory: '{plugin_dir}'."
-            raise NotADirectoryError(msg) from e
+    except NotADirectoryError as e:
+        msg = f"The provided directory exists but is not a directory: '{plugin_dir}'."
+        raise NotADirectoryError(msg) from e
 
+    # Try parsing just the 'tool.streamdeck' table first, only falling back to parsing the whole document
+    # if that table can't be cleanly sliced out of it.
+    streamdeck_table_data = _slice_streamdeck_table(pyproject_data)
+    if streamdeck_table_data is not None:
         try:
-            streamdeck_config = pyproject_config["tool"]["streamdeck"]
+            return cast("StreamDeckConfigDict", toml.loads(streamdeck_table_data.decode())["tool"]["streamdeck"])
+        except (toml.TOMLDecodeError, KeyError):
+            pass
 
-        except KeyError as e:
-            msg = f"Section 'tool.streamdeck' is missing from '{pyproject_path}'."
-            raise KeyError(msg) from e
+    pyproject_config = cast("PyProjectConfigDict", toml.loads(pyproject_data.decode()))
 
-        return streamdeck_config
+    try:
+        streamdeck_config = pyproject_config["tool"]["streamdeck"]
+
+    except KeyError as e:
+        msg = f"Section 'tool.streamdeck' is missing from '{pyproject_path}'."
+        raise KeyError(msg) from e
+
+    return streamdeck_config
+
+
+def _slice_streamdeck_table(pyproject_data: bytes) -> bytes | None:
+    """Slice the '[tool.streamdeck]' table (along with any of its sub-tables) out of the pyproject.toml contents.
+
+    Args:
+        pyproject_data (bytes): The full contents of the pyproject.toml file.
+
+    Returns:
+        bytes | None: The sliced-out table, or None if a '[tool.streamdeck]' table header line wasn't found,
+            or if "streamdeck" is mentioned anywhere outside of it, so that it might not be sliced out in one piece.
+    """
+    header_idx = pyproject_data.find(b"[tool.streamdeck]")
+    if header_idx == -1:
+        return None
+
+    # The header must be the first thing on its line (ignoring indentation), and not e.g. inside a string or comment.
+    line_start_idx = pyproject_data.rfind(b"\n", 0, header_idx) + 1
+    if pyproject_data[line_start_idx:header_idx].strip():
+        return None
+
+    # The table ends at the next table header line that isn't one of its own sub-tables.
+    end_idx = len(pyproject_data)
+    line_idx = pyproject_data.find(b"\n", header_idx)
+    while line_idx != -1:
+        # Skip past the line's indentation without copying the rest of the data.
+        content_idx = line_idx + 1
+        while pyproject_data[content_idx:content_idx + 1] in (b" ", b"\t"):
+            content_idx += 1
+
+        if (
+            pyproject_data.startswith(b"[", content_idx)
+            and not pyproject_data.startswith((b"[tool.streamdeck.", b"[[tool.streamdeck."), content_idx)
+        ):
+            end_idx = line_idx
+            break
+        line_idx = pyproject_data.find(b"\n", line_idx + 1)
+
+    # Sub-tables can also be defined elsewhere, before or after other tables, in which case they'd be cut off from the slice.
+    # TOML allows such headers to be spelled in several ways (e.g. `[ tool.streamdeck.extra ]`, `[tool."streamdeck".extra]`),
+    # so to be safe, any mention of "streamdeck" outside of the slice falls back to parsing the whole document.
+    if pyproject_data.rfind(b"streamdeck", 0, header_idx) != -1 or pyproject_data.find(b"streamdeck", end_idx) != -1:
+        return None
+
+    return pyproject_data[header_idx:end_idx]
+
+
+def extract_plugin_uuid(info: str) -> str:
+    """Extract the plugin's UUID from the -info json object string passed in by the Stream Deck software.
+
+    Args:
+        info (str): The -info json object string.
+
+    Returns:
+        str: The plugin's UUID, as configured in its manifest.json file.
+
+    Raises:
+        KeyError: If the -info json object has no `{"plugin": {"uuid": "..."}}` value.
+    """
+    return cast(str, json.loads(info)["plugin"]["uuid"])
 
 
 class ActionLoader:
     @classmethod
-    def load_actions(cls: type[Self], plugin_dir: Path, files: list[str]) -> Generator[Action, None, None]:
-        # Ensure the parent directory of the plugin modules is in `sys.path`,
+    def load_actions(cls: type[Self], plugin_dir: Path, files: tuple[Path, ...]) -> Generator[Action, None, None]:
+        # Ensure the parent directory of the plugin modules is at the front of `sys.path`,
         # so that import statements in the plugin module will work as expected.
-        if str(plugin_dir) not in sys.path:
-            sys.path.insert(0, str(plugin_dir))
+        # Only the first entry is checked rather than scanning the whole of `sys.path`.
+        plugin_dir_str = str(plugin_dir)
+        if sys.path[:1] != [plugin_dir_str]:
+            sys.path.insert(0, plugin_dir_str)
 
         for action_script in files:
-            module = cls._load_module_from_file(filepath=Path(action_script))
+            module = cls._load_module_from_file(filepath=action_script, plugin_dir=plugin_dir)
             yield from cls._get_actions_from_loaded_module(module=module)
 
     @staticmethod
-    def _load_module_from_file(filepath: Path) -> ModuleType:
+    def _load_module_from_file(filepath: Path, plugin_dir: Path) -> ModuleType:
         """Load module from a given Python file.
 
         Args:
             filepath (str): The path to the Python file.
+            plugin_dir (Path): The plugin's directory, used to derive the name the module is registered under.
 
         Returns:
             ModuleType: A loaded module located at the specified filepath.
@@ -169,32 +296,79 @@ class ActionLoader:
         Raises:
             FileNotFoundError: If the specified file does not exist.
             NotAFileError: If the specified file exists, but is not a file.
+            ImportError: If a different module is already registered under the name derived for the file.
         """
-        # First validate the filepath arg here.
-        if not filepath.exists():
-            msg = f"The file '{filepath}' does not exist."
-            raise FileNotFoundError(msg)
+        # First validate the filepath arg here, with only a single stat call when the filepath is valid.
         if not filepath.is_file():
+            if not filepath.exists():
+                msg = f"The file '{filepath}' does not exist."
+                raise FileNotFoundError(msg)
             msg = f"The provided filepath '{filepath}' is not a file."
             raise NotAFileError(msg)
 
+        module_name = ActionLoader._module_name_for_file(filepath=filepath, plugin_dir=plugin_dir)
+
+        # Never replace a module loaded from some other file, which would break any code already using it.
+        existing_module = sys.modules.get(module_name)
+        existing_module_file = getattr(existing_module, "__file__", None)
+        if existing_module is not None and (
+            existing_module_file is None or Path(existing_module_file).resolve() != filepath.resolve()
+        ):
+            msg = f"Cannot load '{filepath}' as module '{module_name}', as a different module is already registered under that name."
+            raise ImportError(msg, name=module_name, path=str(filepath))
+
         # Create a module specification for a module located at the given filepath.
         # A "specification" is an object that contains information about how to load the module, such as its location and loader.
-        # "module.name" is an arbitrary name used to identify the module internally.
-        spec: ModuleSpec = importlib.util.spec_from_file_location("module.name", str(filepath))  # type: ignore
+        # The loader is explicitly a SourceFileLoader, which compiles the script's source once, caches the bytecode
+        # in a sibling `__pycache__/*.pyc` file, and on subsequent plugin starts loads that bytecode directly
+        # as long as the source file's mtime & size haven't changed.
+        spec: ModuleSpec = importlib.util.spec_from_file_location(  # type: ignore
+            module_name,
+            str(filepath),
+            loader=SourceFileLoader(module_name, str(filepath)),
+        )
         # Create a new module object from the given specification.
         # At this point, the module is created but not yet loaded (i.e. its code hasn't been executed).
         module: ModuleType = importlib.util.module_from_spec(spec)
+        # Register the module before executing it, as the import system would. Code in the module that looks itself up
+        # in `sys.modules` (e.g. dataclasses, pydantic models, pickling) then works as expected.
+        sys.modules[module_name] = module
         # Load the module by executing its code, making available its functions, classes, and variables.
-        spec.loader.exec_module(module)  # type: ignore
+        try:
+            spec.loader.exec_module(module)  # type: ignore
+        except BaseException:
+            del sys.modules[module_name]
+            raise
 
         return module
 
+    @staticmethod
+    def _module_name_for_file(filepath: Path, plugin_dir: Path) -> str:
+        """Derive the name an action script's module is registered under in `sys.modules`.
+
+        The name is namespaced, and built from the script's path relative to the plugin directory
+        (or its absolute path, if it lives outside of it), so that it is unique per script.
+
+        Args:
+            filepath (Path): The path to the action script.
+            plugin_dir (Path): The plugin's directory.
+
+        Returns:
+            str: The module name, e.g. `_streamdeck_actions.actions.main` for `<plugin_dir>/actions/main.py`.
+        """
+        resolved_filepath = filepath.resolve()
+        try:
+            relative_filepath = resolved_filepath.relative_to(plugin_dir.resolve())
+        except ValueError:
+            relative_filepath = resolved_filepath.relative_to(resolved_filepath.anchor)
+
+        return ".".join((_ACTION_MODULES_NAMESPACE, *relative_filepath.with_suffix("").parts))
+
     @staticmethod
     def _get_actions_from_loaded_module(module: ModuleType) -> Generator[Action, None, None]:
-        # Iterate over all attributes in the module to find Action subclasses
-        for attribute_name in dir(module):
-            attribute = getattr(module, attribute_name)
+        # Iterate over the values of the module's namespace directly to find Action instances.
+        # This avoids the sorted name list built by `dir()`, and the `getattr()` lookup per attribute name.
+        for attribute in vars(module).values():
             # Check if the attribute is an instance of the Action class
             if isinstance(attribute, Action):
                 yield attribute
@@ -202,14 +376,29 @@ class ActionLoader:
 
 def main():
     """Main function to parse arguments, load actions, and execute them."""
-    parser = setup_cli()
-    args = cast(CliArgsNamespace, parser.parse_args())
+    if "-h" in sys.argv[1:] or "--help" in sys.argv[1:]:
+        sys.stdout.write(CLI_USAGE)
+        sys.exit(0)
+
+    try:
+        args = parse_cli_args(sys.argv[1:])
+    except CliArgumentError as e:
+        # Same output and exit status as argparse, for usage errors.
+        sys.stderr.write(CLI_USAGE)
+        sys.stderr.write(f"streamdeck: error: {e}\n")
+        sys.exit(2)
+
+    # Deferred imports, so that the heavier dependencies (websockets, pydantic, platformdirs, etc.)
+    # are only loaded once the CLI args have been successfully parsed.
+    from streamdeck.manager import PluginManager
+    from streamdeck.utils.logging import configure_streamdeck_logger
 
     # If `plugin_dir` was not passed in as a cli option, then fall back to using the CWD.
     plugin_dir = args.plugin_dir or Path.cwd()
 
-    info = json.loads(args.info)
-    plugin_uuid = info["plugin"]["uuid"]
+    # Only the plugin's UUID is needed up front, so the raw -info json object string is still passed on as-is
+    # to the PluginManager, which only parses it into a dict if and when it actually needs it.
+    plugin_uuid = extract_plugin_uuid(args.info)
 
     # After configuring once here, we can grab the logger in any other module with `logging.getLogger("streamdeck")`, or
     # a child logger with `logging.getLogger("streamdeck.mycomponent")`, all with the same handler/formatter configuration.
@@ -220,7 +409,8 @@ def main():
         action_scripts=args.action_scripts,
     )
 
-    actions = list(ActionLoader.load_actions(plugin_dir=plugin_dir, files=action_scripts))
+    action_script_paths = tuple(Path(action_script) for action_script in action_scripts)
+    actions = list(ActionLoader.load_actions(plugin_dir=plugin_dir, files=action_script_paths))
 
     manager = PluginManager(
         port=args.port,
@@ -229,7 +419,7 @@ def main():
         # which can be pulled out of `info["plugin"]["uuid"]`
         plugin_registration_uuid=args.pluginUUID,
         register_event=args.registerEvent,
-        info=info,
+        info=args.info,
     )
 
     for action in actions:
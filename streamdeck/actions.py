@@ -1,22 +1,15 @@
 from __future__ import annotations
 
-from collections import defaultdict
-from functools import cached_property
-from logging import getLogger
 from typing import TYPE_CHECKING
 
 
 if TYPE_CHECKING:
-    from collections.abc import Callable, Generator
+    from collections.abc import Callable
 
     from streamdeck.types import EventHandlerFunc, EventNameStr
 
 
-logger = getLogger("streamdeck.actions")
-
-
-
-available_event_names: set[EventNameStr] = {
+available_event_names: frozenset[EventNameStr] = frozenset({
     "applicationDidLaunch",
     "applicationDidTerminate",
     "deviceDidConnect",
@@ -31,17 +24,23 @@ available_event_names: set[EventNameStr] = {
     "keyUp",
     "propertyInspectorDidAppear",
     "propertyInspectorDidDisappear",
+    "sendToPlugin",
     "systemDidWakeUp",
     "titleParametersDidChange",
     "touchTap",
     "willAppear",
     "willDisappear",
-}
+})
 
 
 class Action:
     """Represents an action that can be performed, with event handlers for specific event types."""
 
+    uuid: str
+    """The unique identifier for the action."""
+    name: str
+    """The name of the action, derived from the last part of the UUID."""
+
     def __init__(self, uuid: str):
         """Initialize an Action instance.
 
@@ -49,13 +48,15 @@ class Action:
             uuid (str): The unique identifier for the action.
         """
         self.uuid = uuid
+        self.name = uuid.rpartition(".")[2]
 
-        self._events: dict[EventNameStr, set[EventHandlerFunc]] = defaultdict(set)
-
-    @cached_property
-    def name(self) -> str:
-        """The name of the action, derived from the last part of the UUID."""
-        return self.uuid.split(".")[-1]
+        # Handlers are stored in immutable tuples (rebuilt on the rare registration of a new handler),
+        # so that they can be handed out directly to callers on every event dispatch.
+        self._events: dict[EventNameStr, tuple[EventHandlerFunc, ...]] = {}
+        # Kept in sync with the keys of `_events` as handlers are registered, so reading it doesn't build a new collection.
+        self._registered_event_names: frozenset[EventNameStr] = frozenset()
+        # Callbacks to notify whenever a new handler is registered, e.g. so that registries' handler indexes don't go stale.
+        self._handlers_changed_listeners: list[Callable[[], None]] = []
 
     def on(self, event_name: EventNameStr, /) -> Callable[[EventHandlerFunc], EventHandlerFunc]:
         """Register an event handler for a specific event.
@@ -74,20 +75,38 @@ class Action:
             raise KeyError(msg)
 
         def _wrapper(func: EventHandlerFunc) -> EventHandlerFunc:
-            self._events[event_name].add(func)
+            handlers = self._events.get(event_name, ())
+            # A handler registered more than once for the same event is still only called once per event.
+            if func in handlers:
+                return func
+
+            if not handlers:
+                self._registered_event_names |= {event_name}
+            self._events[event_name] = (*handlers, func)
+
+            for listener in self._handlers_changed_listeners:
+                listener()
 
             return func
 
         return _wrapper
 
-    def get_event_handlers(self, event_name: EventNameStr, /) -> Generator[EventHandlerFunc, None, None]:
+    def add_handlers_changed_listener(self, listener: Callable[[], None], /) -> None:
+        """Add a callback to be called whenever a new event handler is registered on this action.
+
+        Args:
+            listener (Callable[[], None]): The callback to call, with no arguments.
+        """
+        self._handlers_changed_listeners.append(listener)
+
+    def get_event_handlers(self, event_name: EventNameStr, /) -> tuple[EventHandlerFunc, ...]:
         """Get all event handlers for a specific event.
 
         Args:
             event_name (EventName): The name of the event to retrieve handlers for.
 
-        Yields:
-            EventHandlerFunc: The event handler functions for the specified event.
+        Returns:
+            tuple[EventHandlerFunc, ...]: The event handler functions for the specified event.
 
         Raises:
             KeyError: If the provided event name is not available.
@@ -96,7 +115,15 @@ class Action:
             msg = f"Provided event name for pulling handlers from action does not exist: {event_name}"
             raise KeyError(msg)
 
-        yield from self._events[event_name]
+        return self._events.get(event_name, ())
+
+    def get_registered_event_names(self) -> frozenset[EventNameStr]:
+        """Get the names of all events that have handlers registered on this action.
+
+        Returns:
+            frozenset[EventNameStr]: The names of the events with registered handlers.
+        """
+        return self._registered_event_names
 
 
 class ActionRegistry:
@@ -105,6 +132,14 @@ class ActionRegistry:
     def __init__(self) -> None:
         """Initialize an ActionRegistry instance."""
         self._plugin_actions: list[Action] = []
+        # Indexes of the registered actions' handlers, so that dispatching an event is a single dict lookup:
+        # one keyed by event name for events that aren't action-specific, and one keyed by (event name, action uuid)
+        # for action-specific events. They're built on the first lookup, and cleared whenever an action is registered
+        # or a registered action gets a new handler, to be rebuilt on the next lookup.
+        self._handlers_indexes: tuple[
+            dict[EventNameStr, tuple[EventHandlerFunc, ...]],
+            dict[tuple[EventNameStr, str], tuple[EventHandlerFunc, ...]],
+        ] | None = None
 
     def register(self, action: Action) -> None:
         """Register an action with the registry.
@@ -113,8 +148,38 @@ class ActionRegistry:
             action (Action): The action to register.
         """
         self._plugin_actions.append(action)
+        # Rebuild the handler indexes if the action gets new handlers after being registered here.
+        action.add_handlers_changed_listener(self._invalidate_handlers_indexes)
+
+        self._invalidate_handlers_indexes()
+
+    def _invalidate_handlers_indexes(self) -> None:
+        """Clear the handler indexes, so that they are rebuilt from the registered actions on the next lookup."""
+        self._handlers_indexes = None
 
-    def get_action_handlers(self, event_name: EventNameStr, event_action_uuid: str | None = None) -> Generator[EventHandlerFunc, None, None]:
+    def _build_handlers_indexes(self) -> tuple[
+        dict[EventNameStr, tuple[EventHandlerFunc, ...]],
+        dict[tuple[EventNameStr, str], tuple[EventHandlerFunc, ...]],
+    ]:
+        """Build the handler indexes from the handlers of all registered actions, in order of registration.
+
+        Returns:
+            tuple[dict, dict]: The handlers keyed by event name, and the handlers keyed by (event name, action uuid).
+        """
+        handlers_index: dict[EventNameStr, tuple[EventHandlerFunc, ...]] = {}
+        action_handlers_index: dict[tuple[EventNameStr, str], tuple[EventHandlerFunc, ...]] = {}
+
+        for action in self._plugin_actions:
+            for event_name in action.get_registered_event_names():
+                handlers = action.get_event_handlers(event_name)
+                handlers_index[event_name] = (*handlers_index.get(event_name, ()), *handlers)
+
+                action_key = (event_name, action.uuid)
+                action_handlers_index[action_key] = (*action_handlers_index.get(action_key, ()), *handlers)
+
+        return handlers_index, action_handlers_index
+
+    def get_action_handlers(self, event_name: EventNameStr, event_action_uuid: str | None = None) -> tuple[EventHandlerFunc, ...]:
         """Get all event handlers for a specific event from all registered actions.
 
         Args:
@@ -122,13 +187,25 @@ class ActionRegistry:
             event_action_uuid (str | None): The action UUID to get handlers for. 
                 If None (i.e., the event is not action-specific), get all handlers for the event.
 
-        Yields:
-            EventHandlerFunc: The event handler functions for the specified event.
+        Returns:
+            tuple[EventHandlerFunc, ...]: The event handler functions for the specified event.
+
+        Raises:
+            KeyError: If the provided event name is not available.
         """
-        for action in self._plugin_actions:
-            # If the event is action-specific, only get handlers for that action, as we don't want to trigger
-            # and pass this event to handlers for other actions.
-            if event_action_uuid is not None and event_action_uuid != action.uuid:
-                continue
+        if event_name not in available_event_names:
+            msg = f"Provided event name for pulling handlers from registry does not exist: {event_name}"
+            raise KeyError(msg)
+
+        handlers_indexes = self._handlers_indexes
+        if handlers_indexes is None:
+            handlers_indexes = self._handlers_indexes = self._build_handlers_indexes()
+
+        handlers_index, action_handlers_index = handlers_indexes
+
+        if event_action_uuid is None:
+            return handlers_index.get(event_name, ())
 
-            yield from action.get_event_handlers(event_name)
+        # If the event is action-specific, only get handlers for that action, as we don't want to trigger
+        # and pass this event to handlers for other actions.
+        return action_handlers_index.get((event_name, event_action_uuid), ())
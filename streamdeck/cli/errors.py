@@ -18,3 +18,7 @@ class DirectoryNotFoundError(FileNotFoundError):
 
 class NotAFileError(NotADirectoryError):
     """Custom exception to indicate that a provided path is not a file."""
+
+
+class CliArgumentError(ValueError):
+    """Custom exception to indicate that the command-line arguments passed in are invalid."""
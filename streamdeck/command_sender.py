@@ -1,70 +1,78 @@
 from __future__ import annotations
 
-from logging import getLogger
+from types import MappingProxyType
 from typing import TYPE_CHECKING
 
 
 if TYPE_CHECKING:
+    from collections.abc import Mapping
     from typing import Any, Literal
 
     from streamdeck.websocket import WebSocketClient
 
 
+# Value the Stream Deck software takes to mean a trigger description should be hidden.
+_UNDEFINED = "undefined"
 
-logger = getLogger("streamdeck.command_sender")
+# Lookup of `set_image` target names to the target codes expected by the Stream Deck software.
+_TARGET_CODES: Mapping[str, int] = MappingProxyType({
+    "hardware": 1,
+    "software": 2,
+    "both": 0,
+})
 
 
 class StreamDeckCommandSender:
     """Class for sending command event messages to the Stream Deck software through a WebSocket client."""
+
+    __slots__ = ("_client",)
+
     def __init__(self, client: WebSocketClient):
         self._client = client
 
-    def _send_event(self, event: str, **kwargs: Any) -> None:
-        self._client.send_event({
-            "event": event,
-            **kwargs,
-        })
+    def _send_event(self, event_data: dict[str, Any]) -> None:
+        self._client.send_event(event_data)
 
     def set_settings(self, context: str, payload: dict[str, Any]) -> None:
-        self._send_event(
-            event="setSettings",
-            context=context,
-            payload=payload,
-        )
+        self._send_event({
+            "event": "setSettings",
+            "context": context,
+            "payload": payload,
+        })
 
     def get_settings(self, context: str) -> None:
-        self._send_event(
-            event="getSettings",
-            context=context,
-        )
+        self._send_event({
+            "event": "getSettings",
+            "context": context,
+        })
 
     def set_global_settings(self, context: str, payload: dict[str, Any]) -> None:
-        self._send_event(
-            event="setGlobalSettings",
-            context=context,
-            payload=payload,
-        )
+        self._send_event({
+            "event": "setGlobalSettings",
+            "context": context,
+            "payload": payload,
+        })
 
     def get_global_settings(self, context: str) -> None:
         """FYI: It seems like this causes the 'didReceiveGlobalSettings' event to only the Property Inspector."""
-        self._send_event(
-            event="getGlobalSettings",
-            context=context,
-        )
+        self._send_event({
+            "event": "getGlobalSettings",
+            "context": context,
+        })
 
     def open_url(self, context: str, url: str) -> None:
-        self._send_event(
-            event="openUrl",
-            context=context,
-            payload={"url": url},
-        )
+        self._send_event({
+            "event": "openUrl",
+            "context": context,
+            "payload": {"url": url},
+        })
 
     def log_message(self, context: str, message: str) -> None:
-        self._send_event(
-            event="logMessage",
-            context=context,
-            payload={"message": message},
-        )
+        self._send_event({
+            "event": "logMessage",
+            "context": context,
+            "payload": {"message": message},
+        })
 
     def set_title(
         self,
@@ -73,20 +81,18 @@ class StreamDeckCommandSender:
         target: str | None = None,
         title: str | None = None
     ) -> None:
-        payload = {}
-
-        if state is not None:
-            payload["state"] = state
-        if target:
-            payload["target"] = target
-        if title:
-            payload["title"] = title
+        payload = {
+            key: value
+            for key, value in (("state", state), ("target", target), ("title", title))
+            # A `state` of 0 is valid, whereas empty `target` and `title` strings are left out.
+            if value is not None and (value or key == "state")
+        }
 
-        self._send_event(
-            event="setTitle",
-            context=context,
-            payload=payload,
-        )
+        self._send_event({
+            "event": "setTitle",
+            "context": context,
+            "payload": payload,
+        })
 
     def set_image(
         self,
@@ -100,36 +106,31 @@ class StreamDeckCommandSender:
         Raises:
             KeyError: Raised when user passes in an invalid `target` value.
         """
-        target_code_lookup = {
-            "hardware": 1,
-            "software": 2,
-            "both": 0,
-        }
-        target_code = target_code_lookup[target]
+        target_code = _TARGET_CODES[target]
 
-        self._send_event(
-            event="setImage",
-            context=context,
-            payload={
+        self._send_event({
+            "event": "setImage",
+            "context": context,
+            "payload": {
                 "image": image,
                 "target": target_code,
                 "state": state,
             },
-        )
+        })
 
     def set_feedback(self, context: str, payload: dict[str, Any]) -> None:
-        self._send_event(
-            event="setFeedback",
-            context=context,
-            payload=payload,
-        )
+        self._send_event({
+            "event": "setFeedback",
+            "context": context,
+            "payload": payload,
+        })
 
     def set_feedback_layout(self, context: str, layout: str) -> None:
-        self._send_event(
-            event="setFeedbackLayout",
-            context=context,
-            payload={"layout": layout},
-        )
+        self._send_event({
+            "event": "setFeedbackLayout",
+            "context": context,
+            "payload": {"layout": layout},
+        })
 
     def set_trigger_description(
         self,
@@ -159,37 +160,37 @@ class StreamDeckCommandSender:
             long_touch: Describes the long-touch interaction with the touch display.
                 When None, the description will be hidden.
         """
-        self._send_event(
-            event="setTriggerDescription",
-            context=context,
-            payload={
-                "rotate": rotate or "undefined",
-                "push": push or "undefined",
-                "touch": touch or "undefined",
-                "longTouch": long_touch or "undefined",
+        self._send_event({
+            "event": "setTriggerDescription",
+            "context": context,
+            "payload": {
+                "rotate": rotate or _UNDEFINED,
+                "push": push or _UNDEFINED,
+                "touch": touch or _UNDEFINED,
+                "longTouch": long_touch or _UNDEFINED,
             },
-        )
+        })
 
     def show_alert(self, context: str) -> None:
         """Temporarily show an alert icon on the image displayed by an instance of an action."""
-        self._send_event(
-            event="showAlert",
-            context=context,
-        )
+        self._send_event({
+            "event": "showAlert",
+            "context": context,
+        })
 
     def show_ok(self, context: str) -> None:
         """Temporarily show an OK checkmark icon on the image displayed by an instance of an action."""
-        self._send_event(
-            event="showOk",
-            context=context,
-        )
+        self._send_event({
+            "event": "showOk",
+            "context": context,
+        })
 
     def set_state(self, context: str, state: int) -> None:
-        self._send_event(
-            event="setState",
-            context=context,
-            payload={"state": state},
-        )
+        self._send_event({
+            "event": "setState",
+            "context": context,
+            "payload": {"state": state},
+        })
 
     def switch_to_profile(
         self,
@@ -211,27 +212,21 @@ class StreamDeckCommandSender:
             page (int):  Page to show when switching to the profile; indexed from 0.
         """
         # TODO: Should validation happen that ensures the specified profile is declared in manifest.yaml?
-        payload = {}
-
-        if profile is not None:
-            payload = {
-                "profile": profile,
-                "page": page,
-            }
+        payload = {"profile": profile, "page": page} if profile is not None else {}
 
-        self._send_event(
-            event="switchToProfile",
-            context=context,
-            device=device,
-            payload=payload,
-        )
+        self._send_event({
+            "event": "switchToProfile",
+            "context": context,
+            "device": device,
+            "payload": payload,
+        })
 
     def send_to_property_inspector(self, context: str, payload: dict[str, Any]) -> None:
-        self._send_event(
-            event="sendToPropertyInspector",
-            context=context,
-            payload=payload,
-        )
+        self._send_event({
+            "event": "sendToPropertyInspector",
+            "context": context,
+            "payload": payload,
+        })
 
     def send_to_plugin(
         self,
@@ -247,12 +242,12 @@ class StreamDeckCommandSender:
                 which action was triggered.
             payload: The data that will be received by the receiving plugin.
         """
-        self._send_event(
-            event="sendToPlugin",
-            context=context,
-            action=action,
-            payload=payload,
-        )
+        self._send_event({
+            "event": "sendToPlugin",
+            "context": context,
+            "action": action,
+            "payload": payload,
+        })
 
     def send_action_registration(
         self,
@@ -273,7 +268,7 @@ class StreamDeckCommandSender:
             plugin_registration_uuid (str): Randomly-generated unique ID passed in by StreamDeck as -pluginUUID option,
                 used to send back in the registerPlugin event. Note that this is NOT the manifest.json -configured plugin UUID value.
         """
-        self._send_event(
-            event=register_event,
-            uuid=plugin_registration_uuid,
-        )
+        self._send_event({
+            "event": register_event,
+            "uuid": plugin_registration_uuid,
+        })
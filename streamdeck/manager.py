@@ -1,17 +1,19 @@
 from __future__ import annotations
 
 import logging
+from functools import cached_property
 from logging import getLogger
 from typing import TYPE_CHECKING, cast
 
 from streamdeck.actions import ActionRegistry
 from streamdeck.command_sender import StreamDeckCommandSender
-from streamdeck.models.events import event_adapter
+from streamdeck.models.events import action_specific_event_types, event_adapter
 from streamdeck.utils.logging import configure_streamdeck_logger
 from streamdeck.websocket import WebSocketClient
 
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
     from typing import Any, Literal
 
     from streamdeck.actions import Action
@@ -22,6 +24,14 @@ if TYPE_CHECKING:
 logger = getLogger("streamdeck.manager")
 
 
+json_loads: Callable[[str | bytes], Any]
+try:
+    # orjson is an optional, much faster drop-in for parsing json, used if it happens to be installed.
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
+
 
 class PluginManager:
     """Manages plugin actions and communicates with a WebSocket server to handle events."""
@@ -32,7 +42,7 @@ class PluginManager:
         plugin_uuid: str,
         plugin_registration_uuid: str,  # Passed in by Streamdeck to the entry-point script. should we compare what's in the manifest.json file?
         register_event: Literal["registerPlugin"],  # Passed in by Streamdeck to the entry-point script. Will this always be "registerPlugin"?
-        info: dict[str, Any]
+        info: dict[str, Any] | str,
     ):
         """Initialize a PluginManager instance.
 
@@ -45,7 +55,8 @@ class PluginManager:
                 used to send back in the registerPlugin event.
             register_event (str): The registration event type, passed in by the Stream Deck software as -registerEvent option.
                 It's value will almost definitely will be "registerPlugin".
-            info (dict[str, Any]): The information related to the plugin.
+            info (dict[str, Any] | str): The information related to the plugin. This can be passed in as the
+                raw -info json object string, in which case it is only parsed on first access of `PluginManager.info`.
         """
         self._port = port
         self.uuid = plugin_uuid
@@ -55,6 +66,14 @@ class PluginManager:
 
         self._registry = ActionRegistry()
 
+    @cached_property
+    def info(self) -> dict[str, Any]:
+        """The information related to the plugin, parsed from the -info json object string if needed."""
+        if isinstance(self._info, str):
+            return cast("dict[str, Any]", json_loads(self._info))
+
+        return self._info
+
     def register_action(self, action: Action) -> None:
         """Register an action with the PluginManager, and configure its logger.
 
@@ -62,8 +81,9 @@ class PluginManager:
             action (Action): The action to register.
         """
         # First, configure a logger for the action, giving it the last part of its uuid as name.
-        action_component_name = action.uuid.split(".")[-1]
-        configure_streamdeck_logger(name=action_component_name, plugin_uuid=self.uuid)
+        # Unlike the SDK's own logger, it logs at DEBUG level, so that all log records of the plugin dev's handlers are kept.
+        action_component_name = action.name
+        configure_streamdeck_logger(name=action_component_name, plugin_uuid=self.uuid, log_level=logging.DEBUG)
 
         self._registry.register(action)
 
@@ -78,13 +98,22 @@ class PluginManager:
 
             command_sender.send_action_registration(register_event=self._register_event, plugin_registration_uuid=self._registration_uuid)
 
+            # Checked once up front, so that debug logging costs nothing per-event when it isn't enabled.
+            debug_enabled = logger.isEnabledFor(logging.DEBUG)
+            # Bound once, rather than looked up for every message. The validator is the adapter's compiled
+            # core validator, which skips the `TypeAdapter.validate_json` Python wrapper on every message.
+            # Unknown event names are rejected by the adapter's discriminated union, so no separate check is needed.
+            validate_event_json = event_adapter.validator.validate_json
+            get_action_handlers = self._registry.get_action_handlers
+
             for message in client.listen_forever():
-                data: EventBase = event_adapter.validate_json(message)
-                logger.debug("Event received: %s", data.event)
+                data: EventBase = validate_event_json(message)
+                if debug_enabled:
+                    logger.debug("Event received: %s", data.event)
 
                 # If the event is action-specific, we'll pass the action's uuid to the handler to ensure only the correct action is triggered.
-                event_action_uuid: str | None = cast(str, data.action) if data.is_action_specific() else None
+                event_action_uuid: str | None = cast(str, data.action) if type(data) in action_specific_event_types else None
 
-                for handler in self._registry.get_action_handlers(event_name=data.event, event_action_uuid=event_action_uuid):
+                for handler in get_action_handlers(event_name=data.event, event_action_uuid=event_action_uuid):
                     # TODO: from contextual event occurences, save metadata to the action's properties.
                     handler(data)
@@ -1,7 +1,6 @@
 from __future__ import annotations
 
-from abc import ABC
-from typing import Annotated, Any, Literal, Union
+from typing import Annotated, Any, Literal, Union, get_args
 
 from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
 from typing_extensions import TypedDict
@@ -10,7 +9,7 @@ from typing_extensions import TypedDict
 # TODO: Create more explicitly-defined payload objects.
 
 
-class EventBase(BaseModel, ABC):
+class EventBase(BaseModel):
     model_config = ConfigDict(use_attribute_docstrings=True)
 
     event: str
@@ -221,30 +220,38 @@ class WillDisappearEvent(EventBase):
 
 
 
-event_adapter: TypeAdapter[EventBase] = TypeAdapter(
-    Annotated[
-        Union[  # noqa: UP007
-            ApplicationDidLaunchEvent,
-            ApplicationDidTerminateEvent,
-            DeviceDidConnectEvent,
-            DeviceDidDisconnectEvent,
-            DialDownEvent,
-            DialRotateEvent,
-            DialUpEvent,
-            DidReceiveDeepLinkEvent,
-            KeyUpEvent,
-            KeyDownEvent,
-            DidReceivePropertyInspectorMessageEvent,
-            PropertyInspectorDidAppearEvent,
-            PropertyInspectorDidDisappearEvent,
-            DidReceiveGlobalSettingsEvent,
-            DidReceiveSettingsEvent,
-            SystemDidWakeUpEvent,
-            TitleParametersDidChangeEvent,
-            TouchTap,
-            WillAppearEvent,
-            WillDisappearEvent,
-        ],
-        Field(discriminator="event")
-    ]
+_EventUnion = Annotated[
+    Union[  # noqa: UP007
+        ApplicationDidLaunchEvent,
+        ApplicationDidTerminateEvent,
+        DeviceDidConnectEvent,
+        DeviceDidDisconnectEvent,
+        DialDownEvent,
+        DialRotateEvent,
+        DialUpEvent,
+        DidReceiveDeepLinkEvent,
+        KeyUpEvent,
+        KeyDownEvent,
+        DidReceivePropertyInspectorMessageEvent,
+        PropertyInspectorDidAppearEvent,
+        PropertyInspectorDidDisappearEvent,
+        DidReceiveGlobalSettingsEvent,
+        DidReceiveSettingsEvent,
+        SystemDidWakeUpEvent,
+        TitleParametersDidChangeEvent,
+        TouchTap,
+        WillAppearEvent,
+        WillDisappearEvent,
+    ],
+    Field(discriminator="event")
+]
+
+event_adapter: TypeAdapter[EventBase] = TypeAdapter(_EventUnion)
+
+
+# Event types that are specific to an action instance, collected once here so that checking an incoming event
+# is a single set lookup on its type, rather than a check of its model fields on every event.
+# Taken from the adapter's union members, so that every type the adapter can produce is covered.
+action_specific_event_types: frozenset[type[EventBase]] = frozenset(
+    event_type for event_type in get_args(get_args(_EventUnion)[0]) if event_type.is_action_specific()
 )
@@ -26,6 +26,7 @@ EventNameStr: TypeAlias = Literal[  # noqa: UP040
     "keyUp",
     "propertyInspectorDidAppear",
     "propertyInspectorDidDisappear",
+    "sendToPlugin",
     "systemDidWakeUp",
     "titleParametersDidChange",
     "touchTap",
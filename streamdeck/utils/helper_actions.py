@@ -16,7 +16,7 @@ def create_logging_action(action_uuid: str) -> Action:
     """Action that logs the event name of every occurring event."""
     logging_action = Action(action_uuid)
 
-    action_component_name = action_uuid.split(".")[-1]
+    action_component_name = logging_action.name
     logger = getLogger(action_component_name)
 
     def log_event(event_data: EventBase) -> None:
@@ -33,7 +33,7 @@ def create_file_writing_action(action_uuid: str, file: TextIOWrapper) -> Action:
     """Action that saves the full json of every occurring event."""
     file_writing_action = Action(action_uuid)
 
-    action_component_name = action_uuid.split(".")[-1]
+    action_component_name = file_writing_action.name
     logger = getLogger(action_component_name)
 
     def write_event(event_data: EventBase) -> None:
@@ -1,20 +1,29 @@
 """This module provides utility functions for configuring loggers for Elgato Stream Deck plugins.
 
 The module includes functions to set up loggers that write logs to either the centralized Stream Deck user log directory
-or to the installed plugin's local code directory. Each logger is configured with both a stream handler for console output and a
-rotating file handler to manage log file sizes.
+or to the installed plugin's local code directory. Each logger is configured with a rotating file handler to manage log file sizes,
+along with an optional stream handler for console output.
 """
+from __future__ import annotations
+
 import logging
+import sys
 from logging.handlers import RotatingFileHandler
-from pathlib import Path
+from typing import TYPE_CHECKING
 
 from streamdeck.utils.dirs import plugin_local_data_dir, streamdeck_log_dir
 
 
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
 def configure_streamdeck_logger(
     name: str,
     plugin_uuid: str,
-    log_level: int = logging.DEBUG,
+    log_level: int = logging.INFO,
+    *,
+    console: bool | None = None,
 ) -> None:
     """Configure a logger for the Elgato Stream Deck plugin with a rotating file handler.
 
@@ -24,7 +33,9 @@ def configure_streamdeck_logger(
     Args:
         name (str): The name of the logger.
         plugin_uuid (str): The UUID of the plugin.
-        log_level (int, optional): The logging level. Defaults to logging.DEBUG.
+        log_level (int, optional): The logging level. Defaults to logging.INFO.
+        console (bool | None, optional): Whether to also write logs to the console (stderr).
+            Defaults to None, which writes to the console only if stderr is attached to a terminal.
     """
     plugin_log_filepath = streamdeck_log_dir() / f"{plugin_uuid}.log"
 
@@ -32,13 +43,16 @@ def configure_streamdeck_logger(
         name=name,
         filename=plugin_log_filepath,
         level=log_level,
+        console=console,
     )
 
 
 def configure_local_logger(
     name: str,
     plugin_uuid: str,
-    log_level: int = logging.DEBUG,
+    log_level: int = logging.INFO,
+    *,
+    console: bool | None = None,
 ) -> None:
     """Configure a logger for a Stream Deck plugin that writes to a local data directory.
 
@@ -48,10 +62,12 @@ def configure_local_logger(
     Args:
         name (str): The name of the logger.
         plugin_uuid (str): The UUID of the plugin.
-        log_level (int, optional): The logging level. Defaults to logging.DEBUG.
+        log_level (int, optional): The logging level. Defaults to logging.INFO.
+        console (bool | None, optional): Whether to also write logs to the console (stderr).
+            Defaults to None, which writes to the console only if stderr is attached to a terminal.
     """
     # The log file name is the last component of the plugin_uuid.
-    plugin_component_name = plugin_uuid.split(".")[-1]
+    plugin_component_name = plugin_uuid.rpartition(".")[2]
 
     local_log_filepath = (
         plugin_local_data_dir(plugin_uuid=plugin_uuid) / f"logs/{plugin_component_name}.log"
@@ -61,23 +77,28 @@ def configure_local_logger(
         name=name,
         filename=local_log_filepath,
         level=log_level,
+        console=console,
     )
 
 
 def _configure_logger(
     name: str,
     filename: Path,
-    level: int = logging.DEBUG,
+    level: int = logging.INFO,
+    *,
+    console: bool | None = None,
 ) -> logging.Logger:
     """Helper function to configure a logger with a stream handler and a rotating file handler.
 
-    This function ensures that the logger is only configured once by checking its handlers. It sets up both a stream
-    handler for console output and a rotating file handler to save logs to a file.
+    This function ensures that the logger is only configured once by checking its handlers. It sets up a rotating file
+    handler to save logs to a file, and optionally a stream handler for console output.
 
     Args:
         name (str): The name of the logger.
         filename (Path): The path to the log file.
-        level (int, optional): The logging level. Defaults to logging.DEBUG.
+        level (int, optional): The logging level. Defaults to logging.INFO.
+        console (bool | None, optional): Whether to add a stream handler for console output. Defaults to None,
+            which adds one only if stderr is attached to a terminal.
 
     Returns:
         logging.Logger: The configured logger instance.
@@ -89,17 +110,26 @@ def _configure_logger(
         logger.setLevel(level)
 
         formatter = logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
-        stream_handler = logging.StreamHandler()
-        stream_handler.setFormatter(formatter)
-        logger.addHandler(stream_handler)
+
+        # When the plugin is launched by the Stream Deck software, nothing is watching the console output,
+        # so unless asked for explicitly, skip writing every log record to it a second time.
+        if console is None:
+            console = sys.stderr is not None and sys.stderr.isatty()
+
+        if console:
+            stream_handler = logging.StreamHandler()
+            stream_handler.setFormatter(formatter)
+            logger.addHandler(stream_handler)
 
         # Ensure the directory path this logger will write files to exists.
         filename.parent.mkdir(parents=True, exist_ok=True)
 
+        # Delay opening the log file until the first record is actually written to it.
         file_handler = RotatingFileHandler(
             filename.expanduser(),
             maxBytes=5 * 1024 * 1024,
             backupCount=20,
+            delay=True,
         )
         file_handler.setFormatter(formatter)
         logger.addHandler(file_handler)
@@ -38,21 +38,25 @@ class WebSocketClient:
         Args:
             data (dict[str, Any]): The event data to send.
         """
-        data_str = json.dumps(data)
+        # Compact separators, as the message is only read by the Stream Deck software.
+        data_str = json.dumps(data, separators=(",", ":"))
         self._client.send(message=data_str)
 
-    def listen_forever(self) -> Generator[str | bytes, Any, None]:
+    def listen_forever(self) -> Generator[bytes, Any, None]:
         """Listen for messages from the WebSocket server indefinitely.
 
+        Messages are yielded as the raw UTF-8 bytes received, without decoding text frames to str,
+        as the event validation consumes json bytes directly.
+
         TODO: implement more concise error-handling.
 
         Yields:
-            Union[str, bytes]: The received message from the WebSocket server.
+            bytes: The received message from the WebSocket server.
         """
         # TODO: Check that self._client is a connected thing.
         try:
             while True:
-                message: str | bytes = self._client.recv()
+                message: bytes = self._client.recv(decode=False)
                 yield message
 
         except Exception:
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import weakref
 from typing import TYPE_CHECKING
 
 import pytest
@@ -80,9 +81,79 @@ def test_action_register_multiple_handlers_for_event():
     assert handler_one in handlers
     assert handler_two in handlers
 
+
+def test_action_register_same_handler_twice_for_event():
+    """Test that registering the same handler twice for an event only registers it once."""
+    action = Action("test.uuid.for.action")
+
+    @action.on("keyDown")
+    @action.on("keyDown")
+    def handler(event: EventBase):
+        pass
+
+    assert action.get_event_handlers("keyDown") == (handler,)
+
 def test_action_get_event_handlers_invalid_event():
     """Test that getting handlers for an invalid event raises a KeyError."""
     action = Action("test.uuid.for.action")
 
     with pytest.raises(KeyError):
-        list(action.get_event_handlers("invalidEvent"))
\ No newline at end of file
+        list(action.get_event_handlers("invalidEvent"))
+
+@pytest.mark.parametrize(("uuid", "expected_name"), [
+    ("test.uuid.for.action", "action"),
+    ("no-dots-in-uuid", "no-dots-in-uuid"),
+])
+def test_action_name(uuid: str, expected_name: str):
+    """Test that the action's name is derived from the last part of its UUID."""
+    action = Action(uuid)
+
+    assert action.name == expected_name
+
+
+def test_action_get_registered_event_names():
+    """Test that only the names of events with registered handlers are returned."""
+    action = Action("test.uuid.for.action")
+
+    assert action.get_registered_event_names() == frozenset()
+
+    @action.on("keyDown")
+    def handler(event: EventBase):
+        pass
+
+    assert action.get_registered_event_names() == {"keyDown"}
+
+    @action.on("keyDown")
+    def other_handler(event: EventBase):
+        pass
+
+    @action.on("keyUp")
+    def key_up_handler(event: EventBase):
+        pass
+
+    assert action.get_registered_event_names() == {"keyDown", "keyUp"}
+
+
+def test_action_supports_custom_attributes_and_weakrefs():
+    """Test that plugin code can store its own state on an Action instance, and weak-reference it."""
+    action = Action("test.uuid.for.action")
+
+    action.counter = 0  # type: ignore[attr-defined]
+
+    assert action.counter == 0  # type: ignore[attr-defined]
+    assert weakref.ref(action)() is action
+
+
+def test_action_notifies_handlers_changed_listeners():
+    """Test that handlers-changed listeners are called when a new handler is registered, but not for a duplicate."""
+    action = Action("test.uuid.for.action")
+    calls: list[None] = []
+    action.add_handlers_changed_listener(lambda: calls.append(None))
+
+    def handler(event: EventBase):
+        pass
+
+    action.on("keyDown")(handler)
+    action.on("keyDown")(handler)
+
+    assert len(calls) == 1
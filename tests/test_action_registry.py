@@ -96,3 +96,61 @@ def test_get_action_handlers_event_not_available():
 
     with pytest.raises(KeyError):
         list(registry.get_action_handlers("nonExistentEvent"))
+
+
+@pytest.mark.parametrize("event_type", events.EventBase.__subclasses__())
+def test_get_action_handlers_every_event_type_is_available(event_type: type[events.EventBase]):
+    """Test that every event the event adapter accepts can be looked up, even with no handlers registered for it."""
+    registry = ActionRegistry()
+    event_name = event_type.model_fields["event"].annotation.__args__[0]
+
+    assert registry.get_action_handlers(event_name) == ()
+
+
+def test_get_action_handlers_action_specific_event_filters_other_actions():
+    """Test that an action-specific event only returns the handlers of the action it is for."""
+    registry = ActionRegistry()
+
+    action1 = Action("fake-action-uuid-1")
+    action2 = Action("fake-action-uuid-2")
+
+    @action1.on("keyUp")
+    def key_up_handler1(event):
+        pass
+
+    @action2.on("keyUp")
+    def key_up_handler2(event):
+        pass
+
+    registry.register(action1)
+    registry.register(action2)
+
+    fake_event_data: events.KeyUpEvent = KeyUpEventFactory.build(action=action2.uuid)
+    handlers = list(registry.get_action_handlers(event_name=fake_event_data.event, event_action_uuid=fake_event_data.action))
+
+    assert handlers == [key_up_handler2]
+
+
+def test_get_action_handlers_includes_handlers_registered_after_action():
+    """Test that handlers registered on an action after it was registered, even after a lookup, are still returned."""
+    registry = ActionRegistry()
+    action = Action("my-fake-action-uuid")
+
+    @action.on("keyDown")
+    def key_down_handler(event):
+        pass
+
+    registry.register(action)
+    assert registry.get_action_handlers("keyDown") == (key_down_handler,)
+    assert registry.get_action_handlers("keyUp") == ()
+
+    @action.on("keyDown")
+    def key_down_handler2(event):
+        pass
+
+    @action.on("keyUp")
+    def key_up_handler(event):
+        pass
+
+    assert registry.get_action_handlers("keyDown") == (key_down_handler, key_down_handler2)
+    assert registry.get_action_handlers("keyUp", event_action_uuid=action.uuid) == (key_up_handler,)
@@ -0,0 +1,239 @@
+from __future__ import annotations
+
+import importlib.util
+import json
+import logging
+import sys
+from pathlib import Path
+
+import pytest
+from streamdeck.__main__ import (
+    ActionLoader,
+    extract_plugin_uuid,
+    main,
+    parse_cli_args,
+    read_streamdeck_config_from_pyproject,
+)
+from streamdeck.cli.errors import CliArgumentError
+
+
+if sys.version_info >= (3, 11):
+    import tomllib
+else:
+    import tomli as tomllib
+
+
+STREAMDECK_ARGS = [
+    "-port", "28196",
+    "-pluginUUID", "fake-registration-uuid",
+    "-registerEvent", "registerPlugin",
+    "-info", '{"plugin": {"uuid": "com.fake.plugin", "version": "1.0.0"}}',
+]
+
+
+def test_parse_cli_args_streamdeck_options():
+    """Test that the options always passed in by the Stream Deck software are parsed correctly."""
+    args = parse_cli_args(STREAMDECK_ARGS)
+
+    assert args.port == 28196
+    assert args.pluginUUID == "fake-registration-uuid"
+    assert args.registerEvent == "registerPlugin"
+    assert args.info == '{"plugin": {"uuid": "com.fake.plugin", "version": "1.0.0"}}'
+    assert args.plugin_dir is None
+    assert args.action_scripts is None
+
+
+def test_parse_cli_args_plugin_dir():
+    """Test that a positional plugin_dir argument is parsed as a Path."""
+    args = parse_cli_args(["some/plugin/dir", *STREAMDECK_ARGS])
+
+    assert args.plugin_dir == Path("some/plugin/dir")
+    assert args.action_scripts is None
+
+
+def test_parse_cli_args_action_scripts():
+    """Test that --action-scripts consumes values up until the next option."""
+    args = parse_cli_args(["--action-scripts", "one.py", "two.py", *STREAMDECK_ARGS])
+
+    assert args.action_scripts == ["one.py", "two.py"]
+    assert args.plugin_dir is None
+    assert args.port == 28196
+
+
+@pytest.mark.parametrize(
+    "argv",
+    [
+        # Missing a required Stream Deck option.
+        STREAMDECK_ARGS[2:],
+        # Required option missing its value.
+        [*STREAMDECK_ARGS, "-port"],
+        # Non-integer port value.
+        ["-port", "abc", *STREAMDECK_ARGS[2:]],
+        # plugin_dir and --action-scripts are mutually exclusive.
+        ["some/plugin/dir", "--action-scripts", "one.py", *STREAMDECK_ARGS],
+        # --action-scripts without any values.
+        ["--action-scripts", *STREAMDECK_ARGS],
+        # Unrecognized option.
+        ["--unknown", *STREAMDECK_ARGS],
+    ],
+)
+def test_parse_cli_args_invalid(argv: list[str]):
+    """Test that invalid command-line arguments raise a CliArgumentError."""
+    with pytest.raises(CliArgumentError):
+        parse_cli_args(argv)
+
+
+def test_main_invalid_args_exits_with_usage_error(monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]):
+    """Test that invalid command-line arguments exit with argparse's usage error status, 2, and an error message."""
+    monkeypatch.setattr(sys, "argv", ["streamdeck", "-port", "28196"])
+
+    with pytest.raises(SystemExit) as exc_info:
+        main()
+
+    assert exc_info.value.code == 2
+    assert "streamdeck: error:" in capsys.readouterr().err
+
+
+def test_action_loader_caches_bytecode_for_non_py_script(monkeypatch: pytest.MonkeyPatch, tmp_path: Path):
+    """Test that an action script without a '.py' suffix is loaded, and its compiled bytecode cached for subsequent plugin starts.
+
+    Without an explicit loader, importlib wouldn't recognize such a file as Python source at all.
+    """
+    monkeypatch.setattr(sys, "dont_write_bytecode", False)
+    # ActionLoader inserts the plugin dir into sys.path, so keep that from leaking into other tests.
+    monkeypatch.setattr(sys, "path", [*sys.path])
+
+    action_script = tmp_path / "my_action.action"
+    action_script.write_text('from streamdeck.actions import Action\n\nmy_action = Action("com.fake.my-action")\n')
+
+    try:
+        actions = list(ActionLoader.load_actions(plugin_dir=tmp_path, files=(action_script,)))
+
+        assert len(actions) == 1
+        assert actions[0].uuid == "com.fake.my-action"
+        assert Path(importlib.util.cache_from_source(str(action_script))).exists()
+    finally:
+        sys.modules.pop("_streamdeck_actions.my_action", None)
+
+
+@pytest.mark.parametrize(
+    "info",
+    [
+        '{"plugin": {"uuid": "com.fake.plugin", "version": "1.0.0"}}',
+        '{"application": {"font": ".AppleSystemUIFont", "language": "en"}, "plugin" : { "version": "1.0.0", "uuid" :"com.fake.plugin"}}',
+        json.dumps({"devices": [{"id": "ABC", "name": "Stream Deck"}], "plugin": {"uuid": "com.fake.plugin"}}, indent=4),
+        '{"plugin": {"extras": {"uuid": null}, "uuid": "com.fake.plugin"}}',
+        # "plugin" and "uuid" also appear outside of the "plugin" object.
+        '{"application": {"name": "plugin"}, "devices": [{"uuid": "ABC"}], "plugin": {"uuid": "com.fake.plugin"}}',
+    ],
+)
+def test_extract_plugin_uuid(info: str):
+    """Test that the plugin UUID is extracted from the -info json object string."""
+    assert extract_plugin_uuid(info) == "com.fake.plugin"
+
+
+def test_extract_plugin_uuid_missing():
+    """Test that a KeyError is raised when the "plugin" object has no "uuid", even if another object does."""
+    with pytest.raises(KeyError):
+        extract_plugin_uuid('{"plugin": {"version": "1.0.0"}, "other": {"uuid": "com.other.plugin"}}')
+
+
+@pytest.mark.parametrize(
+    "pyproject_contents",
+    [
+        '[project]\nname = "fake-plugin"\n\n[tool.streamdeck]\naction_scripts = ["one.py", "two.py"]\n\n[tool.other]\nkey = 1\n',
+        # Indented table headers, with a sub-table of tool.streamdeck.
+        '[tool.streamdeck]\n    action_scripts = [\n        "one.py",\n        "two.py",\n    ]\n    [tool.streamdeck.extra]\n        key = 1\n',
+        # A sub-table of tool.streamdeck defined after another table, so the whole document has to be parsed.
+        '[tool.streamdeck]\naction_scripts = ["one.py", "two.py"]\n\n[tool.ruff]\nline-length = 100\n\n[tool.streamdeck.extra]\nkey = 1\n',
+        '[tool.streamdeck]\naction_scripts = ["one.py", "two.py"]\n\n[tool.ruff]\nline-length = 100\n\n[ tool.streamdeck.extra ]\nkey = 1\n',
+        '[tool.streamdeck]\naction_scripts = ["one.py", "two.py"]\n\n[tool.ruff]\nline-length = 100\n\n[tool."streamdeck".extra]\nkey = 1\n',
+        '[tool."streamdeck".extra]\nkey = 1\n\n[tool.streamdeck]\naction_scripts = ["one.py", "two.py"]\n',
+        # No '[tool.streamdeck]' header, so the whole document has to be parsed.
+        '[tool]\nstreamdeck = { action_scripts = ["one.py", "two.py"] }\n',
+    ],
+)
+def test_read_streamdeck_config_from_pyproject(tmp_path: Path, pyproject_contents: str):
+    """Test that the 'tool.streamdeck' section is read from the plugin directory's pyproject.toml."""
+    (tmp_path / "pyproject.toml").write_text(pyproject_contents)
+
+    streamdeck_config = read_streamdeck_config_from_pyproject(plugin_dir=tmp_path)
+
+    assert streamdeck_config["action_scripts"] == ["one.py", "two.py"]
+    # The result should match a full parse of the document, including any sub-tables.
+    assert streamdeck_config == tomllib.loads(pyproject_contents)["tool"]["streamdeck"]
+
+
+def test_read_streamdeck_config_from_pyproject_missing_section(tmp_path: Path):
+    """Test that a KeyError is raised when the pyproject.toml has no 'tool.streamdeck' section."""
+    (tmp_path / "pyproject.toml").write_text('[project]\nname = "fake-plugin"\n')
+
+    with pytest.raises(KeyError):
+        read_streamdeck_config_from_pyproject(plugin_dir=tmp_path)
+
+
+def test_read_streamdeck_config_from_pyproject_missing_file(tmp_path: Path):
+    """Test that a FileNotFoundError is raised when the plugin directory has no pyproject.toml."""
+    with pytest.raises(FileNotFoundError):
+        read_streamdeck_config_from_pyproject(plugin_dir=tmp_path)
+
+
+def test_action_loader_registers_module(monkeypatch: pytest.MonkeyPatch, tmp_path: Path):
+    """Test that a loaded action script is registered in sys.modules, so code relying on that (e.g. dataclasses) works."""
+    monkeypatch.setattr(sys, "path", [*sys.path])
+
+    action_script = tmp_path / "my_dataclass_action.py"
+    action_script.write_text(
+        "from __future__ import annotations\n"
+        "from dataclasses import dataclass\n"
+        "from streamdeck.actions import Action\n\n"
+        "@dataclass\n"
+        "class Config:\n"
+        "    name: str\n\n"
+        'my_action = Action("com.fake.my-dataclass-action")\n'
+    )
+
+    try:
+        actions = list(ActionLoader.load_actions(plugin_dir=tmp_path, files=(action_script,)))
+
+        assert len(actions) == 1
+        assert sys.modules["_streamdeck_actions.my_dataclass_action"].__file__ == str(action_script)
+    finally:
+        sys.modules.pop("_streamdeck_actions.my_dataclass_action", None)
+
+
+def test_action_loader_does_not_shadow_existing_modules(monkeypatch: pytest.MonkeyPatch, tmp_path: Path):
+    """Test that action scripts named after other modules, or each other, don't replace them in sys.modules."""
+    monkeypatch.setattr(sys, "path", [*sys.path])
+
+    action_scripts: list[Path] = []
+    for index, relative_path in enumerate(["logging.py", "one/main.py", "two/main.py"]):
+        action_script = tmp_path / relative_path
+        action_script.parent.mkdir(parents=True, exist_ok=True)
+        action_script.write_text(f'from streamdeck.actions import Action\n\nmy_action = Action("com.fake.action-{index}")\n')
+        action_scripts.append(action_script)
+
+    module_names = ["_streamdeck_actions.logging", "_streamdeck_actions.one.main", "_streamdeck_actions.two.main"]
+    try:
+        actions = list(ActionLoader.load_actions(plugin_dir=tmp_path, files=tuple(action_scripts)))
+
+        assert [action.uuid for action in actions] == ["com.fake.action-0", "com.fake.action-1", "com.fake.action-2"]
+        assert sys.modules["logging"] is logging
+        assert [sys.modules[module_name].__file__ for module_name in module_names] == [str(path) for path in action_scripts]
+    finally:
+        for module_name in module_names:
+            sys.modules.pop(module_name, None)
+
+
+def test_action_loader_refuses_to_replace_other_module(monkeypatch: pytest.MonkeyPatch, tmp_path: Path):
+    """Test that an ImportError is raised rather than replacing a module loaded from a different file."""
+    monkeypatch.setattr(sys, "path", [*sys.path])
+    monkeypatch.setitem(sys.modules, "_streamdeck_actions.my_action", logging)
+
+    action_script = tmp_path / "my_action.py"
+    action_script.write_text("")
+
+    with pytest.raises(ImportError):
+        list(ActionLoader.load_actions(plugin_dir=tmp_path, files=(action_script,)))
+
+    assert sys.modules["_streamdeck_actions.my_action"] is logging
@@ -167,4 +167,41 @@ def test_command_sender_methods(
     }
 
     # Assert that the client's send_event method was called with the expected data
-    mock_client.send_event.assert_called_once_with(expected_data)
\ No newline at end of file
+    mock_client.send_event.assert_called_once_with(expected_data)
+
+
+@pytest.mark.parametrize(
+    ("extra_args", "expected_payload"),
+    [
+        ({}, {}),
+        ({"state": 0}, {"state": 0}),
+        ({"state": 1, "target": "", "title": ""}, {"state": 1}),
+        ({"target": "fake_target", "title": "fake_title"}, {"target": "fake_target", "title": "fake_title"}),
+    ],
+)
+def test_set_title_payload_omits_unset_values(
+    command_sender: StreamDeckCommandSender,
+    mock_client: Mock,
+    extra_args: dict,
+    expected_payload: dict,
+):
+    """Test that set_title only includes the given values in its payload."""
+    command_sender.set_title("fake_context", **extra_args)
+
+    mock_client.send_event.assert_called_once_with({
+        "event": "setTitle",
+        "context": "fake_context",
+        "payload": expected_payload,
+    })
+
+
+def test_switch_to_profile_without_profile(command_sender: StreamDeckCommandSender, mock_client: Mock):
+    """Test that switch_to_profile sends an empty payload when no profile is given."""
+    command_sender.switch_to_profile("fake_context", device="fake device")
+
+    mock_client.send_event.assert_called_once_with({
+        "event": "switchToProfile",
+        "context": "fake_context",
+        "device": "fake device",
+        "payload": {},
+    })
@@ -113,3 +113,25 @@ def test_streamdeck_logger(fake_streamdeck_log_dir: Path):
         assert LOG_STATEMENT in actual_log_file_output
         # Probably don't need to assert that the logger's name is in the log.
         assert FAKE_LOGGER_NAME in actual_log_file_output
+
+
+@pytest.mark.parametrize(("console", "expect_stream_handler"), [(True, True), (False, False)])
+def test_streamdeck_logger_console(fake_streamdeck_log_dir: Path, console: bool, expect_stream_handler: bool):
+    """Test that a stream handler for console output is added to the logger only when asked for.
+
+    Args:
+        fake_streamdeck_log_dir (Path): The fake Stream Deck log directory path provided by the fixture.
+        console (bool): Whether to configure the logger with console output.
+        expect_stream_handler (bool): Whether the logger is expected to have a console stream handler.
+    """
+    FAKE_LOGGER_NAME = f"my_test_console_{console}"
+    FAKE_PLUGIN_UUID = "com.test.plugin"
+
+    configure_streamdeck_logger(name=FAKE_LOGGER_NAME, plugin_uuid=FAKE_PLUGIN_UUID, console=console)
+    logger = logging.getLogger(FAKE_LOGGER_NAME)
+
+    stream_handlers = [
+        handler for handler in logger.handlers
+        if isinstance(handler, logging.StreamHandler) and not isinstance(handler, logging.FileHandler)
+    ]
+    assert bool(stream_handlers) is expect_stream_handler
@@ -1,4 +1,6 @@
+import logging
 import uuid
+from types import SimpleNamespace
 from typing import cast
 from unittest.mock import MagicMock, Mock
 
@@ -7,7 +9,16 @@ import pytest_mock
 from polyfactory.factories.pydantic_factory import ModelFactory
 from streamdeck.actions import Action
 from streamdeck.manager import PluginManager
-from streamdeck.models.events import DialRotateEvent, EventBase, event_adapter
+from streamdeck.models.events import (
+    ApplicationDidLaunchEvent,
+    DeviceDidConnectEvent,
+    DialRotateEvent,
+    EventBase,
+    KeyDownEvent,
+    WillAppearEvent,
+    action_specific_event_types,
+    event_adapter,
+)
 from streamdeck.websocket import WebSocketClient
 
 
@@ -92,7 +103,10 @@ def _spy_action_registry_get_action_handlers(
 
 @pytest.fixture
 def _spy_event_adapter_validate_json(mocker: pytest_mock.MockerFixture) -> None:
-    """Fixture that wraps and spies on the event_adapter.validate_json method.
+    """Fixture that wraps and spies on the validate_json method of the event_adapter's core validator.
+
+    The compiled core validator can't have its attributes patched, so it's swapped out for a stand-in
+    that delegates to it, which can then be spied on.
 
     Args:
         mocker: pytest-mock's mocker fixture.
@@ -100,7 +114,9 @@ def _spy_event_adapter_validate_json(mocker: pytest_mock.MockerFixture) -> None:
     Returns:
         None
     """
-    mocker.spy(event_adapter, "validate_json")
+    validator = SimpleNamespace(validate_json=event_adapter.validator.validate_json)
+    mocker.patch.object(event_adapter, "validator", validator)
+    mocker.spy(validator, "validate_json")
 
 
 def test_plugin_manager_register_action(plugin_manager: PluginManager):
@@ -114,6 +130,27 @@ def test_plugin_manager_register_action(plugin_manager: PluginManager):
     assert plugin_manager._registry._plugin_actions[0] == action
 
 
+def test_plugin_manager_register_action_configures_debug_logger(plugin_manager: PluginManager):
+    """Test that registering an action configures a DEBUG-level logger named after the action."""
+    action = Action("com.fake.plugin.my-debug-logged-action")
+    plugin_manager.register_action(action)
+
+    assert logging.getLogger(action.name).level == logging.DEBUG
+
+
+def test_plugin_manager_info_parses_json_string(port_number: int):
+    """Test that PluginManager.info parses the raw -info json object string on access."""
+    plugin_manager = PluginManager(
+        port=port_number,
+        plugin_uuid="test-plugin-uuid",
+        plugin_registration_uuid=str(uuid.uuid1()),
+        register_event="registerPlugin",
+        info='{"plugin": {"uuid": "test-plugin-uuid"}}',
+    )
+
+    assert plugin_manager.info == {"plugin": {"uuid": "test-plugin-uuid"}}
+
+
 @pytest.mark.usefixtures("patch_websocket_client")
 def test_plugin_manager_sends_registration_event(
     mock_command_sender: Mock, plugin_manager: PluginManager
@@ -132,7 +169,7 @@ def test_plugin_manager_sends_registration_event(
 def test_plugin_manager_process_event(
     patch_websocket_client: tuple[MagicMock, EventBase], plugin_manager: PluginManager
 ):
-    """Test that PluginManager processes events correctly, calling event_adapter.validate_json and action_registry.get_action_handlers."""
+    """Test that PluginManager processes events correctly, calling event_adapter's validator and action_registry.get_action_handlers."""
     mock_websocket_client, fake_event_message = patch_websocket_client
 
     plugin_manager.run()
@@ -141,8 +178,8 @@ def test_plugin_manager_process_event(
     # This has been stubbed to return the fake_event_message's json string.
     mock_websocket_client.listen_forever.assert_called_once()
 
-    # Check that the event_adapter.validate_json method was called with the stub json string returned by listen_forever().
-    spied_event_adapter_validate_json = cast(Mock, event_adapter.validate_json)
+    # Check that the event_adapter's validate_json method was called with the stub json string returned by listen_forever().
+    spied_event_adapter_validate_json = cast(Mock, event_adapter.validator.validate_json)
     spied_event_adapter_validate_json.assert_called_once_with(fake_event_message.model_dump_json())
     # Check that the validate_json method returns the same event type model as the fake_event_message.
     assert spied_event_adapter_validate_json.spy_return == fake_event_message
@@ -152,3 +189,18 @@ def test_plugin_manager_process_event(
         event_name=fake_event_message.event, event_action_uuid=fake_event_message.action
     )
 
+
+
+@pytest.mark.parametrize(
+    ("event_type", "expected"),
+    [
+        (DialRotateEvent, True),
+        (KeyDownEvent, True),
+        (WillAppearEvent, True),
+        (ApplicationDidLaunchEvent, False),
+        (DeviceDidConnectEvent, False),
+    ],
+)
+def test_action_specific_event_types_covers_adapter_union_members(event_type: type[EventBase], expected: bool):
+    """Test that the action-specific event types are taken from the event_adapter's union members."""
+    assert (event_type in action_specific_event_types) is expected
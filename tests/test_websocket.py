@@ -42,7 +42,7 @@ def test_send_event_serializes_and_sends(mock_connection: Mock, port_number: int
         client.send_event(fake_data)
 
     # Assert that the 'send' method was called once with the serialized data.
-    expected_message = json.dumps(fake_data)
+    expected_message = json.dumps(fake_data, separators=(",", ":"))
     mock_connection.send.assert_called_once_with(message=expected_message)
 
 
@@ -50,9 +50,11 @@ def test_send_event_serializes_and_sends(mock_connection: Mock, port_number: int
 def test_listen_forever_yields_messages(mock_connection: Mock, port_number: int):
     """Test that listen_forever yields messages from the WebSocket connection."""
     # Set up the mocked connection to return messages until closing
-    mock_connection.recv.side_effect = ["message1", b"message2", WebSocketException()]
+    mock_connection.recv.side_effect = [b"message1", b"message2", WebSocketException()]
 
     with WebSocketClient(port=port_number) as client:
         messages = list(client.listen_forever())
 
-    assert messages == ["message1", b"message2"]
\ No newline at end of file
+    assert messages == [b"message1", b"message2"]
+    # Text frames should be received as raw bytes, skipping the decode to str.
+    mock_connection.recv.assert_called_with(decode=False)
\ No newline at end of file